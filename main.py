@@ -1,24 +1,52 @@
 #main.py
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
+import cachetools
 import httpx
+import ijson
+import orjson
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
+from google.auth.exceptions import GoogleAuthError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from datetime import datetime, timedelta
+from googleapiclient.http import build_http
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import google_auth_httplib2
+import httplib2
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
+import asyncio
+import atexit
+import collections
+import contextlib
 import json
+import logging
 import os
+import re
+import threading
+import time
+import uuid
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 API_KEY = os.getenv('TICKETMASTER_CONSUMER_KEY')
 BASE_URL = "https://app.ticketmaster.com/discovery/v2/events.json"
+# Above this page size, stream-parse the response instead of loading it whole
+STREAM_PARSE_MIN_SIZE = 20
+# Ticketmaster allows 5 requests per second per API key
+TM_RATE_LIMIT = 5
+TM_RATE_WINDOW_SECONDS = 1.0
+# Event listings change over minutes to hours, so reuse recent search results
+SEARCH_CACHE_TTL_SECONDS = 300
 
 # Create an MCP server
 mcp = FastMCP(
@@ -32,7 +60,8 @@ class SurgeSettings(BaseSettings):
     model_config: SettingsConfigDict = SettingsConfigDict(
         env_prefix="SURGE_", 
         env_file=".env",
-        extra='ignore'  # This fixes the validation error!
+        extra='ignore',  # This fixes the validation error!
+        frozen=True  # Read once at import to build the Surge headers/payload
     )
         
     api_key: str
@@ -44,87 +73,306 @@ class SurgeSettings(BaseSettings):
 # Create settings instance once at module level
 surge_settings = SurgeSettings()
 
+# Shared HTTP clients so keep-alive connections are reused across tool calls
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+
+_tm_client = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=10.0)
+# Parsed once so requests only need to merge in the query params
+_TM_URL = httpx.URL(BASE_URL)
+
+# Everything in a Surge message except the body is fixed, so build it once
+_SURGE_HEADERS = {
+    "Authorization": f"Bearer {surge_settings.api_key}",
+    "Surge-Account": surge_settings.account_id,
+    "Content-Type": "application/json",
+}
+_SURGE_CONTACT = {
+    "first_name": surge_settings.my_first_name,
+    "last_name": surge_settings.my_last_name,
+    "phone_number": surge_settings.my_phone_number,
+}
+_SURGE_PAYLOAD_TEMPLATE = {"body": None, "conversation": {"contact": _SURGE_CONTACT}}
+
+_surge_client = httpx.AsyncClient(
+    base_url="https://api.surge.app",
+    headers=_SURGE_HEADERS,
+    http2=True,
+    limits=_HTTP_LIMITS,
+    timeout=10.0,
+)
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry only on rate limiting (429) and server-side (5xx) failures"""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    status = exc.response.status_code
+    return status == 429 or status >= 500
+
+# Don't let a single Retry-After hold a tool call open for longer than this
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+def _wait_retry_after(retry_state) -> float:
+    """Honor the Retry-After header, given either in seconds or as an HTTP date"""
+    exc = retry_state.outcome.exception()
+    retry_after = exc.response.headers.get("Retry-After") if isinstance(exc, httpx.HTTPStatusError) else None
+    if not retry_after:
+        return 0.0
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return 0.0
+    return min(max(0.0, delay), MAX_RETRY_AFTER_SECONDS)
+
+# Exponential backoff with full jitter on top of whatever the server asks us to wait
+_retry_on_throttle = retry(
+    retry=retry_if_exception(_is_retryable),
+    wait=wait_random_exponential(multiplier=0.5, max=30) + _wait_retry_after,
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+
+class SlidingWindowLimiter:
+    """Delay calls so that at most max_calls start within any period-second window"""
+    
+    __slots__ = ('period', '_calls', '_lock')
+    
+    def __init__(self, max_calls: int, period: float):
+        self.period = period
+        self._calls = collections.deque(maxlen=max_calls)
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            if len(self._calls) == self._calls.maxlen:
+                wait = self.period - (time.monotonic() - self._calls[0])
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._calls.append(time.monotonic())
+
+# Waiting locally is much cheaper than a 429 followed by a backoff retry
+_tm_limiter = SlidingWindowLimiter(TM_RATE_LIMIT, TM_RATE_WINDOW_SECONDS)
+
+class AIMDGate:
+    """
+    Cap in-flight requests to one host, adapting the cap with AIMD
+    
+    The cap grows by 0.5 while recent latency stays at or under the target and
+    is halved on 429/5xx responses or timeouts.
+    """
+    
+    __slots__ = ('limit', 'target_ms', 'min_limit', 'max_limit', '_in_flight', '_latencies', '_cond')
+    
+    def __init__(self, target_ms: float = 400.0, min_limit: int = 1, max_limit: int = 16, initial: float = 4.0):
+        self.limit = initial
+        self.target_ms = target_ms
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._in_flight = 0
+        self._latencies = collections.deque(maxlen=32)
+        self._cond = asyncio.Condition()
+    
+    def _record(self, latency_ms: float, ok: bool):
+        if not ok:
+            self.limit = max(self.min_limit, self.limit * 0.5)
+            return
+        self._latencies.append(latency_ms)
+        if sum(self._latencies) / len(self._latencies) <= self.target_ms:
+            self.limit = min(self.max_limit, self.limit + 0.5)
+    
+    @contextlib.asynccontextmanager
+    async def admit(self):
+        """Wait for a free slot, then time the request made inside the block"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        
+        started = time.monotonic()
+        ok = None
+        try:
+            yield
+            ok = True
+        except httpx.HTTPStatusError as e:
+            # Only rate limiting and server errors mean the host is overloaded
+            ok = not _is_retryable(e)
+            raise
+        except httpx.TimeoutException:
+            ok = False
+            raise
+        finally:
+            async with self._cond:
+                if ok is not None:
+                    self._record((time.monotonic() - started) * 1000, ok)
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+_tm_gate = AIMDGate()
+_surge_gate = AIMDGate()
+
+@_retry_on_throttle
+async def _tm_get(params: dict) -> httpx.Response:
+    await _tm_limiter.acquire()
+    async with _tm_gate.admit():
+        response = await _tm_client.get(_TM_URL, params=params)
+        response.raise_for_status()
+    return response
+
+@_retry_on_throttle
+async def _surge_post(content: bytes, idempotency_key: str) -> httpx.Response:
+    # The same key is sent on every attempt so a retried request can't double-send the SMS
+    async with _surge_gate.admit():
+        response = await _surge_client.post(
+            "/messages",
+            content=content,
+            headers={"Idempotency-Key": idempotency_key},
+        )
+        response.raise_for_status()
+    return response
+
 @mcp.tool()
-def text_me_my_event(message: str) -> str:
+async def text_me_my_event(message: str) -> str:
     """This is a tool that takes a prompt for a user who is looking to book events based on his/her hobby"""
     # For now, just send the message - you can add event booking logic here
-    return textme(message)
+    return await textme(message)
 
 @mcp.tool(name="textme", description="Send a text message to me")
-def textme(text_content: str) -> str:
+async def textme(text_content: str) -> str:
     """Send a text message to a phone number via https://surgemsg.com/"""
     try:
-        with httpx.Client() as client:
-            response = client.post(
-                "https://api.surge.app/messages",  # Fixed URL
-                headers={
-                    "Authorization": f"Bearer {surge_settings.api_key}",
-                    "Surge-Account": surge_settings.account_id,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "body": text_content,
-                    "conversation": {
-                        "contact": {
-                            "first_name": surge_settings.my_first_name,
-                            "last_name": surge_settings.my_last_name,
-                            "phone_number": surge_settings.my_phone_number,
-                        }
-                    },
-                },
-            )
-            response.raise_for_status()
-            return f"Message sent successfully: {text_content}"
+        await _surge_post(
+            # Serialized once up front; the client headers already declare application/json
+            orjson.dumps(_SURGE_PAYLOAD_TEMPLATE | {"body": text_content}),
+            idempotency_key=str(uuid.uuid4()),
+        )
+        return f"Message sent successfully: {text_content}"
     except httpx.HTTPStatusError as e:
         return f"Error sending message: {e.response.status_code} - {e.response.text}"
     except Exception as e:
         return f"Error sending message: {str(e)}"
 
+def _format_event(event: dict) -> str:
+    """Format a Ticketmaster event as 'Event Name | Date at Time | Venue | URL'"""
+    try:
+        name = event['name']
+    except KeyError:
+        name = 'Unknown Event'
+    start = event.get('dates', {}).get('start', {})
+    date = start.get('localDate', 'TBD')
+    local_time = start.get('localTime')
+    try:
+        venue = event['_embedded']['venues'][0]['name']
+    except (KeyError, IndexError):
+        venue = 'Unknown Venue'
+    url = event.get('url', '')
+    
+    if local_time:
+        return f"{name} | {date} at {local_time} | {venue} | {url}"
+    return f"{name} | {date} | {venue} | {url}"
+
+@_retry_on_throttle
+async def _tm_stream_events(params: dict) -> List[str]:
+    """Fetch events and format them as they arrive, without building the whole JSON document"""
+    await _tm_limiter.acquire()
+    async with _tm_gate.admit():
+        async with _tm_client.stream("GET", _TM_URL, params=params) as response:
+            if response.is_error:
+                # Read the body so the error message can include it
+                await response.aread()
+                response.raise_for_status()
+        
+            events = ijson.sendable_list()
+            parser = ijson.items_coro(events, "_embedded.events.item")
+            events_list = []
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                events_list.extend(_format_event(event) for event in events)
+                del events[:]
+            parser.close()
+            events_list.extend(_format_event(event) for event in events)
+            return events_list
+
+async def _fetch_events(keyword: str, size: int) -> str:
+    """Query Ticketmaster and return the formatted event lines"""
+    # Let httpx URL-encode the query so spaces, '&' or '#' in the keyword are safe
+    params = {"size": size, "keyword": keyword, "apikey": API_KEY}
+    
+    if size > STREAM_PARSE_MIN_SIZE:
+        events_list = await _tm_stream_events(params) or ["No events found"]
+        return "\n".join(events_list)
+    
+    response = await _tm_get(params)
+        
+    data = orjson.loads(response.content)
+        
+    # Extract events from response
+    try:
+        events_list = [_format_event(event) for event in data['_embedded']['events']]
+    except KeyError:
+        events_list = ["No events found"]
+        
+    return "\n".join(events_list)
+
+# Formatted results keyed by (normalized keyword, size); errors are never stored
+_search_cache = cachetools.TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL_SECONDS)
+
 @mcp.tool(name="searchevents", description="Search for events using Ticketmaster API")
 
-def search_events(keyword: str) -> str:
+async def search_events(keyword: str, size: int = 10) -> str:
     """Search for events using the Ticketmaster API"""
-    url = f"{BASE_URL}?size=10&keyword={keyword}&apikey={API_KEY}"
+    key = (keyword.strip().lower(), size)
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return cached
         
     try:
-        with httpx.Client() as client:
-            response = client.get(url)
-            response.raise_for_status()
-                
-            data = response.json()
-                
-            events_list = []
-                
-            # Extract events from response
-            if '_embedded' in data and 'events' in data['_embedded']:
-                for event in data['_embedded']['events']:
-                    name = event.get('name', 'Unknown Event')
-                    date = event.get('dates', {}).get('start', {}).get('localDate', 'TBD')
-                    time = event.get('dates', {}).get('start', {}).get('localTime', '')
-                    venue = event.get('_embedded', {}).get('venues', [{}])[0].get('name', 'Unknown Venue')
-                    url = event.get('url', '')
-                    
-                    # Format: "Event Name | Date at Time | Venue | URL"
-                    time_part = f" at {time}" if time else ""
-                    event_info = f"{name} | {date}{time_part} | {venue} | {url}"
-                    events_list.append(event_info)
-            else:
-                events_list.append("No events found")
-                
-            return "\n".join(events_list)
-            
+        result = await _fetch_events(*key)
     except httpx.HTTPStatusError as e:
         return f"Error searching events: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
+    except (httpx.HTTPError, orjson.JSONDecodeError, ijson.JSONError) as e:
+        # Network failures and malformed response bodies
         return f"Error searching events: {str(e)}"
+    
+    _search_cache[key] = result
+    return result
+
+@mcp.tool(name="searchevents_multi", description="Search Ticketmaster for several keywords concurrently")
+async def search_events_multi(keywords: List[str]) -> str:
+    """Run search_events for each keyword concurrently and group the results by keyword"""
+    results = await asyncio.gather(*(search_events(keyword) for keyword in keywords))
+    return "\n\n".join(f"{keyword}:\n{result}" for keyword, result in zip(keywords, results))
 
 
 # If modifying these scopes, delete the file token.json.
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Google's batch endpoint accepts at most 50 calls per HTTP request
+CALENDAR_BATCH_LIMIT = 50
+
+# Parallel inserts stay well under the per-user write quota (500 requests / 100s)
+CALENDAR_MAX_WORKERS = 8
+# googleapiclient retries 429, 5xx and rate-limit 403s with exponential backoff
+CALENDAR_NUM_RETRIES = 4
+
+# Failures below the Calendar API itself: OAuth refresh, httplib2 and socket errors
+CALENDAR_TRANSPORT_ERRORS = (GoogleAuthError, httplib2.HttpLib2Error, OSError)
+
+# Refresh the access token this long before it actually expires
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
 class GoogleCalendarManager:
+    __slots__ = ('service', 'creds', '_refresh_timer', '_thread_local', '_creds_lock', '_executor')
+    
     def __init__(self):
         self.service = None
+        self.creds = None
+        self._refresh_timer = None
+        self._thread_local = threading.local()
+        # Serializes background refreshes and token.json writes
+        self._creds_lock = threading.Lock()
+        # Long-lived so each worker's per-thread connection is reused across calls
+        self._executor = ThreadPoolExecutor(max_workers=CALENDAR_MAX_WORKERS)
         self.authenticate()
     
     def authenticate(self):
@@ -146,14 +394,55 @@ class GoogleCalendarManager:
                 creds = flow.run_local_server(port=0)
             
             # Save the credentials for the next run
-            with open('token.json', 'w') as token:
-                token.write(creds.to_json())
+            self._save_credentials(creds)
         
-        self.service = build('calendar', 'v3', credentials=creds)
+        self.creds = creds
+        # Use the discovery document bundled with googleapiclient instead of fetching it
+        self.service = build('calendar', 'v3', credentials=creds, static_discovery=True)
+        self._schedule_refresh()
     
-    def create_event(self, title, start_datetime, end_datetime=None, 
-                    description=None, location=None, timezone='America/New_York'):
-        """Create a calendar event"""
+    def _save_credentials(self, creds):
+        """Write token.json atomically so a crash mid-write can't corrupt it"""
+        tmp_path = 'token.json.tmp'
+        with open(tmp_path, 'w') as token:
+            token.write(creds.to_json())
+        os.replace(tmp_path, 'token.json')
+    
+    def _schedule_refresh(self):
+        """Refresh the token in the background shortly before it expires"""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+        if not self.creds.refresh_token or not self.creds.expiry:
+            return
+        
+        # google-auth stores expiry as a naive UTC datetime
+        refresh_at = self.creds.expiry - TOKEN_REFRESH_MARGIN
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        delay = max(0.0, (refresh_at - now).total_seconds())
+        self._refresh_timer = threading.Timer(delay, self._refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _refresh(self):
+        try:
+            with self._creds_lock:
+                self.creds.refresh(Request())
+                self._save_credentials(self.creds)
+        except (GoogleAuthError, OSError) as e:
+            # Leave it to the next API call to refresh lazily
+            logger.warning("Background token refresh failed: %s", e)
+            return
+        self._schedule_refresh()
+    
+    def close(self):
+        """Stop the background refresh and the insert worker threads"""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _build_event_body(self, title, start_datetime, end_datetime=None, 
+                          description=None, location=None, tz='America/New_York'):
+        """Build the Google Calendar API body for an event"""
         
         if not end_datetime:
             # Default to 2 hours if no end time specified
@@ -163,17 +452,17 @@ class GoogleCalendarManager:
         start_time = start_datetime.isoformat()
         end_time = end_datetime.isoformat()
         
-        event = {
+        return {
             'summary': title,
             'location': location,
             'description': description,
             'start': {
                 'dateTime': start_time,
-                'timeZone': timezone,
+                'timeZone': tz,
             },
             'end': {
                 'dateTime': end_time,
-                'timeZone': timezone,
+                'timeZone': tz,
             },
             'reminders': {
                 'useDefault': False,
@@ -183,34 +472,203 @@ class GoogleCalendarManager:
                 ],
             },
         }
+    
+    @staticmethod
+    def _success_result(title, event_result):
+        return {
+            'success': True,
+            'event_id': event_result.get('id'),
+            'html_link': event_result.get('htmlLink'),
+            'message': f"Event '{title}' created successfully"
+        }
+    
+    @staticmethod
+    def _failure_result(error):
+        return {
+            'success': False,
+            'error': str(error),
+            'message': f"Failed to create event: {error}"
+        }
+    
+    def create_event(self, title, start_datetime, end_datetime=None, 
+                    description=None, location=None, tz='America/New_York'):
+        """Create a calendar event"""
+        
+        event = self._build_event_body(
+            title, start_datetime, end_datetime, description, location, tz
+        )
         
         try:
             event_result = self.service.events().insert(
                 calendarId='primary', 
                 body=event
-            ).execute()
+            ).execute(http=self._thread_http(), num_retries=CALENDAR_NUM_RETRIES)
             
-            return {
-                'success': True,
-                'event_id': event_result.get('id'),
-                'html_link': event_result.get('htmlLink'),
-                'message': f"Event '{title}' created successfully"
-            }
+            return self._success_result(title, event_result)
             
         except HttpError as error:
-            return {
-                'success': False,
-                'error': str(error),
-                'message': f"Failed to create event: {error}"
-            }
-
-# Initialize the calendar manager
-calendar_manager = GoogleCalendarManager()    
+            return self._failure_result(error)
+    
+    def create_events_batch(self, events):
+        """
+        Create several calendar events using batched HTTP requests
+        
+        Args:
+            events: List of dicts with the same keyword arguments as create_event
+        
+        Returns:
+            List of result dicts (same shape as create_event), in input order
+        """
+        results = [None] * len(events)
+        
+        def collect(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                results[index] = self._failure_result(exception)
+            else:
+                results[index] = self._success_result(events[index]['title'], response)
+        
+        for start in range(0, len(events), CALENDAR_BATCH_LIMIT):
+            indices = range(start, min(start + CALENDAR_BATCH_LIMIT, len(events)))
+            batch = self.service.new_batch_http_request(callback=collect)
+            for index in indices:
+                batch.add(
+                    self.service.events().insert(
+                        calendarId='primary',
+                        body=self._build_event_body(**events[index])
+                    ),
+                    request_id=str(index)
+                )
+            
+            try:
+                # Never the service's shared http; other threads may be using it
+                batch.execute(http=self._thread_http())
+            except (HttpError, ValueError, *CALENDAR_TRANSPORT_ERRORS) as error:
+                # The batch request failed as a whole (ValueError comes from a
+                # malformed multipart response), so callbacks may not have run.
+                # Keep going so earlier chunks that were inserted are still reported.
+                for index in indices:
+                    if results[index] is None:
+                        results[index] = self._failure_result(error)
+        
+        return results
+    
+    def _thread_http(self):
+        """httplib2 isn't thread-safe, so each worker thread gets its own authorized connection"""
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            # build_http() applies the same default socket timeout as the service's own http
+            http = google_auth_httplib2.AuthorizedHttp(self.creds, http=build_http())
+            self._thread_local.http = http
+        return http
+    
+    def _insert_event(self, event):
+        return self.service.events().insert(
+            calendarId='primary',
+            body=event
+        ).execute(http=self._thread_http(), num_retries=CALENDAR_NUM_RETRIES)
+    
+    def create_events_parallel(self, events):
+        """
+        Create several calendar events with concurrent single-event requests
+        
+        Use this instead of create_events_batch when events need to go out as
+        individual requests, e.g. so each one gets its own retries.
+        
+        Args:
+            events: List of dicts with the same keyword arguments as create_event
+        
+        Returns:
+            List of result dicts (same shape as create_event), in input order
+        """
+        results = [None] * len(events)
+        
+        futures = {
+            self._executor.submit(self._insert_event, self._build_event_body(**event)): index
+            for index, event in enumerate(events)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = self._success_result(events[index]['title'], future.result())
+            except (HttpError, *CALENDAR_TRANSPORT_ERRORS) as error:
+                # Record it and keep collecting, so inserts that succeeded are still reported
+                results[index] = self._failure_result(error)
+        
+        return results
+
+# "Event Name | Date | Venue | URL" as produced by search_events (URL is optional).
+# Like the original split, venue is the third field and the URL the last one.
+_EVENT_INFO_RE = re.compile(r"^\s*([^|]+?) \| ([^|]+?) \| ([^|]*?)(?: \| (?:.* \| )?([^|]*))?$")
+# "2025-08-15 at 19:30[:00]", "2025-08-15 at 7:30" or just "2025-08-15"
+_DT_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?: at (\d{1,2}):(\d{2}))?")
+
+def _parse_event_info(event_info: str):
+    """Split a search_events line into (title, start datetime, venue, url)"""
+    match = _EVENT_INFO_RE.match(event_info)
+    if not match:
+        raise ValueError("Invalid event format. Expected: 'Event Name | Date | Venue | URL'")
+    title, date_part, venue, url = match.groups()
+    
+    dt_match = _DT_RE.match(date_part)
+    if not dt_match:
+        raise ValueError(f"Unrecognized event date: {date_part!r}")
+    year, month, day, hour, minute = dt_match.groups()
+    if hour is None and ":" in date_part.partition(" at ")[2]:
+        # A clock time we can't read is an error rather than a silent 7 PM;
+        # text without ':' (e.g. "TBA", "7pm") still gets the default below
+        raise ValueError(f"Unrecognized event time: {date_part!r}")
+    # Default to 7 PM if no time specified
+    event_datetime = datetime(
+        int(year), int(month), int(day),
+        int(hour) if hour else 19,
+        int(minute) if minute else 0,
+    )
+    
+    url = url.strip() if url and url.startswith(("http://", "https://")) else None
+    return title.strip(), event_datetime, venue.strip() or None, url
+
+def _ticketmaster_calendar_event(event_info: str) -> dict:
+    """Turn a search_events line into keyword arguments for create_event"""
+    title, event_datetime, venue, url = _parse_event_info(event_info)
+    
+    # Create description with URL if available
+    description = "Ticketmaster Event"
+    if url:
+        description += f"\nTickets: {url}"
+    
+    return {
+        'title': title,
+        'start_datetime': event_datetime,
+        'end_datetime': event_datetime + timedelta(hours=3),  # Most events are ~3 hours
+        'description': description,
+        'location': venue,
+    }
+
+# Created on first use so importing the server doesn't trigger OAuth
+_calendar_manager = None
+_calendar_lock = threading.Lock()
+
+def _calendar() -> GoogleCalendarManager:
+    """
+    Return the shared calendar manager, creating it on first use
+    
+    Creation may run the interactive OAuth consent flow, so call this off the
+    event loop (asyncio.to_thread). The lock keeps concurrent first calls from
+    each starting their own flow.
+    """
+    global _calendar_manager
+    with _calendar_lock:
+        if _calendar_manager is None:
+            _calendar_manager = GoogleCalendarManager()
+            atexit.register(_calendar_manager.close)
+        return _calendar_manager
+
 @mcp.tool(
     name="save_ticketmaster_event",
     description="Save a Ticketmaster event to Google Calendar with automatic parsing"
 )
-def save_ticketmaster_event(event_info: str) -> str:
+async def save_ticketmaster_event(event_info: str) -> str:
     """
     Save a Ticketmaster event to Google Calendar
     Automatically parses event information from Ticketmaster search results
@@ -224,53 +682,69 @@ def save_ticketmaster_event(event_info: str) -> str:
     """
     
     try:
-        # Parse the event info string
-        parts = event_info.split(" | ")
-        
-        if len(parts) < 3:
-            return "❌ Invalid event format. Expected: 'Event Name | Date | Venue | URL'"
-        
-        title = parts[0].strip()
-        date_part = parts[1].strip()
-        venue = parts[2].strip() if len(parts) > 2 else None
-        url = parts[-1].strip() if "http" in parts[-1] else None
-        
-        # Extract date (assumes format like "2025-08-15 at 19:30" or just "2025-08-15")
-        if " at " in date_part:
-            date_str, time_str = date_part.split(" at ")
-            time_str = time_str.strip()
+        event = _ticketmaster_calendar_event(event_info)
+    except ValueError as e:
+        return f"❌ Error parsing event: {str(e)}"
+    
+    # create_event reports Calendar API errors in its result; this catches the
+    # failures underneath it, e.g. a missing client_secret.json or a failed refresh
+    try:
+        calendar = await asyncio.to_thread(_calendar)
+        result = await asyncio.to_thread(calendar.create_event, **event)
+    except CALENDAR_TRANSPORT_ERRORS as e:
+        return f"❌ Failed to save event: {str(e)}"
+    
+    if result['success']:
+        return f"🎫 Ticketmaster event saved to calendar!\n{event['title']}\n📅 {event['start_datetime']:%Y-%m-%d at %H:%M}\n📍 {event['location']}\nView: {result['html_link']}"
+    else:
+        return f"❌ Failed to save event: {result['message']}"
+
+@mcp.tool(
+    name="save_ticketmaster_events_bulk",
+    description="Save several Ticketmaster events to Google Calendar in one batched request"
+)
+async def save_ticketmaster_events_bulk(event_infos: List[str], parallel: bool = False) -> str:
+    """
+    Save several Ticketmaster events to Google Calendar
+    
+    Args:
+        event_infos: Event information strings from Ticketmaster search
+                     Format: "Event Name | Date | Venue | URL"
+        parallel: Send one request per event concurrently instead of a single
+                  batch, so each insert is retried on its own when rate limited
+    
+    Returns:
+        One success/failure line per event
+    """
+    
+    lines = []
+    events = []
+    for event_info in event_infos:
+        try:
+            events.append(_ticketmaster_calendar_event(event_info))
+        except ValueError as e:
+            lines.append(f"❌ Skipped '{event_info}': {e}")
+    
+    if not events:
+        results = []
+    else:
+        try:
+            calendar = await asyncio.to_thread(_calendar)
+        except CALENDAR_TRANSPORT_ERRORS as e:
+            return f"❌ Failed to connect to Google Calendar: {str(e)}"
+        if parallel:
+            results = await asyncio.to_thread(calendar.create_events_parallel, events)
         else:
-            date_str = date_part
-            time_str = "19:00"  # Default to 7 PM if no time specified
-        
-        # Handle different time formats
-        if ":" not in time_str:
-            time_str = "19:00"  # Default time
-        
-        # Create description with URL if available
-        description = f"Ticketmaster Event"
-        if url:
-            description += f"\nTickets: {url}"
-        
-        # Create the calendar event
-        event_datetime = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-        end_datetime = event_datetime + timedelta(hours=3)  # Most events are ~3 hours
-        
-        result = calendar_manager.create_event(
-            title=title,
-            start_datetime=event_datetime,
-            end_datetime=end_datetime,
-            description=description,
-            location=venue
-        )
-        
+            results = await asyncio.to_thread(calendar.create_events_batch, events)
+    saved = 0
+    for event, result in zip(events, results):
         if result['success']:
-            return f"🎫 Ticketmaster event saved to calendar!\n{title}\n📅 {date_str} at {time_str}\n📍 {venue}\nView: {result['html_link']}"
+            saved += 1
+            lines.append(f"🎫 {event['title']} | 📅 {event['start_datetime']:%Y-%m-%d at %H:%M} | View: {result['html_link']}")
         else:
-            return f"❌ Failed to save event: {result['message']}"
-            
-    except Exception as e:
-        return f"❌ Error parsing/saving event: {str(e)}"
+            lines.append(f"❌ Failed to save '{event['title']}': {result['message']}")
+    
+    return "\n".join([f"Saved {saved} of {len(event_infos)} events to calendar"] + lines)
     
 #events = search_events("Club World Cup")
 